@@ -6,17 +6,66 @@
  * Correct endpoint found via DevTools: /course-search/api/?page=fose&route=search&subject=CSC
  */
 
+const { randomUUID } = require('crypto');
 const fs = require('fs').promises;
 const path = require('path');
+const { promisify } = require('util');
+const zlib = require('zlib');
+
+// Statuses worth retrying (rate limiting / transient upstream errors)
+const RETRY_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+// Filler words that carry no signal for course search
+const STOP_WORDS = new Set(['a', 'an', 'and', 'for', 'i', 'ii', 'in', 'of', 'on', 'the', 'to', 'with']);
+
+const tokenize = text =>
+  (text.toLowerCase().match(/[a-z0-9]+/g) || []).filter(t => !STOP_WORDS.has(t));
+
+// Cache compression picked by file extension; anything else is stored as plain JSON
+const CODECS = {
+  '.gz': { encode: promisify(zlib.gzip), decode: promisify(zlib.gunzip) },
+  '.br': { encode: promisify(zlib.brotliCompress), decode: promisify(zlib.brotliDecompress) }
+};
+
+// Max raw inputs remembered by the getCourseByCode lookup cache
+const LOOKUP_CACHE_SIZE = 1024;
+
+// Canonical course code form: "csc  116 " -> "CSC 116"
+const normalizeCode = code => code.toUpperCase().trim().replace(/\s+/g, ' ');
+
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+
+// Non-2xx response from the catalog API
+class HttpError extends Error {
+  constructor(response) {
+    super(`HTTP ${response.status}: ${response.statusText}`);
+    this.name = 'HttpError';
+    this.status = response.status;
+  }
+}
+
+// Failures the retry loop and stale-cache fallback should absorb: HTTP status,
+// fetch's network TypeError, system errors (fs/zlib) and malformed JSON.
+// Anything else is a bug and is rethrown.
+const isFetchError = error =>
+  error instanceof HttpError ||
+  error instanceof SyntaxError ||
+  (error instanceof TypeError && error.message === 'fetch failed') ||
+  (typeof error.code === 'string' && !(error instanceof TypeError));
 
 class CourseFetcher {
-  constructor(cacheDir = './data') {
+  constructor(cacheDir = './data', { cacheFile = 'csc_courses.json', indent = 0 } = {}) {
     // FIXED: correct base URL includes /course-search/
     this.apiUrl = 'https://catalog.ncsu.edu/course-search/api/?page=fose&route=search&subject=CSC';
     this.cacheDir = cacheDir;
+    this.cacheFile = path.join(cacheDir, cacheFile);  // e.g. 'csc_courses.json.br' to compress
+    // ETag / Last-Modified from the last full response, used to revalidate the cache
+    this.metaFile = `${this.cacheFile}.meta.json`;
+    this.indent = indent;  // JSON indentation for the cache; compact unless a human reads it
 
     this.headers = {
       'Accept': 'application/json, text/javascript, */*; q=0.01',
+      'Accept-Encoding': 'br, gzip, deflate',  // fetch only offers gzip/deflate unless told otherwise
       'Content-Type': 'application/json',
       'Origin': 'https://catalog.ncsu.edu',
       'Referer': 'https://catalog.ncsu.edu/course-search/',
@@ -28,123 +77,530 @@ class CourseFetcher {
       other: { srcdb: '' },
       criteria: [{ field: 'subject', value: 'CSC' }]
     };
+
+    // fetch already pools keep-alive connections; _post only adds retries on top
+    this.retry = { total: 5, backoffMs: 500, jitterMs: 500 };
+
+    // After `threshold` consecutive failed fetches, skip the network for `cooldownMs`
+    this.breaker = { threshold: 3, cooldownMs: 5 * 60 * 1000, failures: 0, openUntil: 0 };
+
+    // Lookup indexes for the most recently queried course list
+    this._byCode = new Map();
+    this._bySubject = new Map();
+    this._codeLookups = new Map();  // raw getCourseByCode input -> course, LRU order
+    this._indexedCourses = null;  // caller's list, only used for the identity check
+
+    // Search index, built lazily by the first searchCourses call for that list
+    this._snapshot = null;  // private copy the search index resolves positions against
+    this._postings = new Map();  // term -> [[courseIndex, tf-idf weight]]
+
+    // Other subjects loaded through fetchSubjects, keyed by subject code
+    this._fetchedSubjects = new Map();
+
+    // In-flight fetchAllCourses promises, keyed by useCache
+    this._inflight = new Map();
+
+    // Last parsed cache file: { file, mtimeMs, courses }
+    this._memCache = null;
   }
 
-  async fetchAllCourses(useCache = true) {
-    const cacheFile = path.join(this.cacheDir, 'csc_courses.json');
+  // Concurrent callers share one load/refresh instead of each hitting disk or network
+  fetchAllCourses(useCache = true) {
+    if (!this._inflight.has(useCache)) {
+      const pending = this._fetchAllCourses(useCache)
+        .finally(() => this._inflight.delete(useCache));
+      this._inflight.set(useCache, pending);
+    }
+    return this._inflight.get(useCache);
+  }
+
+  async _fetchAllCourses(useCache) {
+    const cacheFile = this.cacheFile;
 
     // Check cache first
+    let conditional = {};
     if (useCache) {
-      const cacheAge = await this._getCacheAge(cacheFile);
+      // One stat serves both the age check and the in-memory cache key
+      const stats = await this._statCache(cacheFile);
+      const cacheAge = this._getCacheAge(stats);
       if (cacheAge < 24) {
         console.log(`✓ Using cached data (age: ${cacheAge.toFixed(1)} hours)`);
-        return await this._loadCache(cacheFile);
+        return await this._loadCache(cacheFile, stats);
       } else if (cacheAge < Infinity) {
-        console.log(`⚠ Cache is ${cacheAge.toFixed(1)} hours old, refreshing...`);
+        console.log(`⚠ Cache is ${cacheAge.toFixed(1)} hours old, revalidating...`);
+        conditional = await this._conditionalHeaders();
       }
     }
 
+    // A forced refresh (useCache=false) always goes to the network
+    if (useCache && this._breakerOpen()) {
+      console.log('⚠ Catalog API recently failing, skipping fetch');
+      return await this._loadStaleCache(cacheFile);
+    }
+
     console.log('🔍 Fetching CSC courses from NCSU catalog...');
 
     try {
-      const response = await fetch(this.apiUrl, {
-        method: 'POST',
-        headers: this.headers,
-        body: JSON.stringify(this.payload)
-      });
+      const response = await this._post(this.apiUrl, this.payload, conditional);
+
+      // Server confirmed our copy is current: skip the body and just refresh the mtime
+      if (response.status === 304) {
+        await response.body?.cancel();
+        const now = new Date();
+        await fs.utimes(cacheFile, now, now);
+        console.log('✓ Catalog unchanged, cache revalidated');
+        this._recordSuccess();
+        return await this._loadCache(cacheFile);
+      }
 
       if (!response.ok) {
-        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        await response.body?.cancel();
+        throw new HttpError(response);
       }
 
       const data = await response.json();
       const courses = this._parseAndDeduplicate(data.results || []);
+      this._recordSuccess();
 
-      await this._saveCache(cacheFile, courses);
+      // Validators must only describe content that actually reached disk
+      if (await this._saveCache(cacheFile, courses)) await this._saveMeta(response.headers);
       console.log(`✓ Fetched ${courses.length} unique CSC courses`);
 
       return courses;
 
     } catch (error) {
+      if (!isFetchError(error)) throw error;
       console.error(`✗ Error fetching courses: ${error.message}`);
+      this._recordFailure();
+      return await this._loadStaleCache(cacheFile);
+    }
+  }
 
-      // Fall back to stale cache if available
+  // Fall back to stale cache if available
+  async _loadStaleCache(cacheFile) {
+    try {
+      const staleData = await this._loadCache(cacheFile);
+      console.log('⚠ Using stale cache as fallback');
+      return staleData;
+    } catch {
+      return null;
+    }
+  }
+
+  _breakerOpen() {
+    return Date.now() < this.breaker.openUntil;
+  }
+
+  // Any successful response (e.g. a forced refresh) closes the breaker again
+  _recordSuccess() {
+    this.breaker.failures = 0;
+    this.breaker.openUntil = 0;
+  }
+
+  _recordFailure() {
+    if (++this.breaker.failures >= this.breaker.threshold) {
+      this.breaker.openUntil = Date.now() + this.breaker.cooldownMs;
+    }
+  }
+
+  async _post(url, payload, headers = {}) {
+    const body = JSON.stringify(payload);
+
+    for (let attempt = 0; ; attempt++) {
+      // Exponential backoff plus random jitter so retrying clients don't synchronize
+      const backoff = this.retry.backoffMs * 2 ** attempt + Math.random() * this.retry.jitterMs;
       try {
-        const staleData = await this._loadCache(cacheFile);
-        console.log('⚠ Using stale cache as fallback');
-        return staleData;
-      } catch {
-        return null;
+        const response = await fetch(url, { method: 'POST', headers: { ...this.headers, ...headers }, body });
+        if (!RETRY_STATUSES.has(response.status) || attempt >= this.retry.total) {
+          return response;
+        }
+        await response.body?.cancel();  // release the connection back to the pool
+      } catch (error) {
+        // Only transient network failures are retried; bugs surface immediately
+        if (!isFetchError(error) || attempt >= this.retry.total) throw error;
+      }
+      await sleep(backoff);
+    }
+  }
+
+  // Fetch several subjects concurrently over fetch's keep-alive pool
+  async fetchSubjects(subjects, concurrency = 8) {
+    const queue = [...new Set(subjects.map(s => s.toUpperCase().trim()))];
+    const results = {};
+
+    const worker = async () => {
+      while (queue.length) {
+        const subject = queue.shift();
+        const courses = await this._fetchSubject(subject);
+
+        // A failed refetch keeps whatever loaded earlier instead of wiping it
+        if (courses) this._fetchedSubjects.set(subject, courses);
+        results[subject] = this._fetchedSubjects.get(subject) || [];
+      }
+    };
+
+    const workers = Math.max(1, Math.min(concurrency, queue.length));
+    await Promise.all(Array.from({ length: workers }, worker));
+    return results;
+  }
+
+  // Returns null on failure so callers can tell it apart from an empty subject
+  async _fetchSubject(subject) {
+    const url = new URL(this.apiUrl);
+    url.searchParams.set('subject', subject);
+    const payload = { ...this.payload, criteria: [{ field: 'subject', value: subject }] };
+
+    if (this._breakerOpen()) {
+      console.log(`⚠ Catalog API recently failing, skipping ${subject}`);
+      return null;
+    }
+
+    try {
+      const response = await this._post(url, payload);
+
+      if (!response.ok) {
+        await response.body?.cancel();
+        throw new HttpError(response);
       }
+
+      const data = await response.json();
+      this._recordSuccess();
+      return this._parseAndDeduplicate(data.results || [], { index: false });
+
+    } catch (error) {
+      if (!isFetchError(error)) throw error;
+      console.error(`✗ Error fetching ${subject} courses: ${error.message}`);
+      this._recordFailure();
+      return null;
     }
   }
 
-  _parseAndDeduplicate(results) {
+  // Dedupes, projects and indexes the raw results in a single pass
+  _parseAndDeduplicate(results, { index = true } = {}) {
     const seen = new Set();
-    return results
-      .filter(course => {
-        if (seen.has(course.code)) return false;
-        seen.add(course.code);
-        return true;
-      })
-      .map(course => ({
-        id: course.code.replace(' ', ''),  // "CSC 116" -> "CSC116"
-        code: course.code,                 // "CSC 116"
+    const courses = [];
+    const byCode = new Map();
+    const bySubject = new Map();
+
+    for (const course of results) {
+      const code = normalizeCode(course.code);
+      if (seen.has(code)) continue;
+      seen.add(code);
+
+      const record = {
+        id: code.replace(' ', ''),         // "CSC 116" -> "CSC116"
+        code,                              // "CSC 116"
         title: course.title,
         key: course.key,                   // used for detail lookups later
         credits: 3,                        // default - enrich later if needed
         prerequisites: [],                 // enrich later with Bedrock
         offered: []                        // enrich later if needed
-      }));
+      };
+      courses.push(record);
+      if (index) this._indexCourse(record, byCode, bySubject, code);
+    }
+
+    // Only installed once every record parsed, so a bad result leaves the old indexes usable
+    if (index) this._installIndexes(courses, byCode, bySubject);
+    return courses;
   }
 
   async getCourseByCode(courseCode, courses = null) {
     if (!courses) courses = await this.fetchAllCourses();
     if (!courses) return null;
 
-    const code = courseCode.toUpperCase().trim();
-    return courses.find(c => c.code.toUpperCase() === code) || null;
+    this._ensureIndexes(courses);
+    return this._lookupCode(courseCode);
+  }
+
+  // Repeat lookups of popular codes hit this LRU and skip normalization entirely
+  _lookupCode(courseCode) {
+    const cache = this._codeLookups;
+    if (cache.has(courseCode)) {
+      const course = cache.get(courseCode);
+      cache.delete(courseCode);
+      cache.set(courseCode, course);
+      return course;
+    }
+
+    const course = this._byCode.get(normalizeCode(courseCode)) || null;
+    cache.set(courseCode, course);
+    if (cache.size > LOOKUP_CACHE_SIZE) cache.delete(cache.keys().next().value);
+    return course;
+  }
+
+  async getCoursesBySubject(subject = 'CSC', courses = null) {
+    // Backward compatible with the old getCoursesBySubject(courses) signature,
+    // including getCoursesBySubject(null) meaning "all CSC courses"
+    if (Array.isArray(subject)) [subject, courses] = ['CSC', subject];
+    if (subject == null) subject = 'CSC';
+
+    if (!courses) courses = await this.fetchAllCourses();
+    if (!courses) return [];
+
+    this._ensureIndexes(courses);
+    const key = subject.toUpperCase().trim();
+    const bucket = this._bySubject.get(key) || this._fetchedSubjects.get(key) || [];
+    return bucket.slice();  // a copy, so callers can't reorder or truncate the index
   }
 
-  async getCoursesBySubject(courses = null) {
+  // Courses in any of the given subjects, grouped in the order the subjects are listed
+  async getCoursesBySubjects(subjects, courses = null) {
     if (!courses) courses = await this.fetchAllCourses();
-    return courses || [];
+    if (!courses) return [];
+
+    const unique = new Set(subjects.map(s => s.toUpperCase().trim()));
+    const groups = await Promise.all([...unique].map(s => this.getCoursesBySubject(s, courses)));
+    return groups.flat();
   }
 
   async searchCourses(query, courses = null) {
     if (!courses) courses = await this.fetchAllCourses();
     if (!courses) return [];
 
-    const term = query.toLowerCase();
-    return courses.filter(c =>
-      c.title.toLowerCase().includes(term) ||
-      c.code.toLowerCase().includes(term) ||
-      c.id.toLowerCase().includes(term)
-    );
+    this._ensureIndexes(courses);
+    this._ensureSearchIndex();
+
+    // Several queries match any of them, answered by one combined pattern scan
+    if (Array.isArray(query)) return this._substringSearch(query.map(q => q.toLowerCase()));
+
+    // Whole-word TF-IDF hits first, then any substring-only matches ("CSC 11",
+    // "data" inside "Database") so ranking never drops a result
+    const ranked = this._rankedSearch(query);
+    const seen = new Set(ranked);
+    const rest = this._substringSearch([query.toLowerCase()]).filter(c => !seen.has(c));
+    return ranked.concat(rest);
+  }
+
+  // Indexes are keyed to the list they were built from; a reload yields a new list
+  _ensureIndexes(courses) {
+    if (courses !== this._indexedCourses) this._buildIndexes(courses);
   }
 
-  async _getCacheAge(cacheFile) {
+  _buildIndexes(courses) {
+    const byCode = new Map();
+    const bySubject = new Map();
+    for (const course of courses) this._indexCourse(course, byCode, bySubject);
+    this._installIndexes(courses, byCode, bySubject);
+  }
+
+  // Fresh fetches pass the code they already normalized; caller lists and older caches are normalized here
+  _indexCourse(course, byCode, bySubject, code = normalizeCode(course.code)) {
+    const space = code.indexOf(' ');
+    const subject = space === -1 ? code : code.slice(0, space);
+
+    if (!byCode.has(code)) byCode.set(code, course);
+
+    const bucket = bySubject.get(subject);
+    if (bucket) bucket.push(course);
+    else bySubject.set(subject, [course]);
+  }
+
+  // Maps are built locally and swapped in whole, so a failed build never leaves them half-filled
+  _installIndexes(courses, byCode, bySubject) {
+    this._byCode = byCode;
+    this._bySubject = bySubject;
+    this._codeLookups.clear();
+    this._snapshot = null;  // search index is rebuilt on demand
+    this._indexedCourses = courses;
+  }
+
+  // The search index costs far more than the Maps, so only searches pay for it
+  _ensureSearchIndex() {
+    if (this._snapshot) return;
+    // Callers may sort or splice their list; positions must stay tied to this copy
+    this._snapshot = this._indexedCourses.slice();
+    this._buildSearchIndex(this._snapshot);
+  }
+
+  // TF-IDF weights per course, L2-normalized so scores are cosine similarities
+  _buildSearchIndex(courses) {
+    const docs = courses.map(c => tokenize(`${c.code} ${c.id} ${c.title}`));
+
+    const docFreq = new Map();
+    for (const tokens of docs) {
+      for (const t of new Set(tokens)) docFreq.set(t, (docFreq.get(t) || 0) + 1);
+    }
+
+    this._idf = new Map();
+    for (const [t, df] of docFreq) {
+      this._idf.set(t, Math.log((1 + docs.length) / (1 + df)) + 1);
+    }
+
+    // One lowercased haystack for substring scans; _offsets[i] is where course i starts
+    const fields = courses.map(c => `${c.title}\x1f${c.code}\x1f${c.id}`.toLowerCase());
+    this._haystack = fields.join('\x1e');
+    this._offsets = [];
+    let offset = 0;
+    for (const f of fields) {
+      this._offsets.push(offset);
+      offset += f.length + 1;
+    }
+
+    this._postings = new Map();
+    docs.forEach((tokens, i) => {
+      for (const [t, weight] of this._weigh(tokens)) {
+        if (!this._postings.has(t)) this._postings.set(t, []);
+        this._postings.get(t).push([i, weight]);
+      }
+    });
+  }
+
+  _weigh(tokens) {
+    const weights = new Map();
+    for (const t of tokens) {
+      if (this._idf.has(t)) weights.set(t, (weights.get(t) || 0) + this._idf.get(t));
+    }
+
+    const norm = Math.hypot(...weights.values()) || 1;
+    for (const [t, w] of weights) weights.set(t, w / norm);
+    return weights;
+  }
+
+  // One precompiled regex scan over the haystack, jumping to the next course on a hit
+  _substringSearch(terms) {
+    const courses = this._snapshot;
+    if (!terms.length) return [];
+    if (terms.some(t => !t)) return [...courses];
+
+    const pattern = this._compilePattern(terms);
+    pattern.lastIndex = 0;
+
+    const matches = [];
+    let match;
+    while ((match = pattern.exec(this._haystack)) !== null) {
+      const i = this._courseAt(match.index);
+      matches.push(courses[i]);
+      if (i + 1 >= courses.length) break;
+      pattern.lastIndex = this._offsets[i + 1];
+    }
+    return matches;
+  }
+
+  // Keeps the last compiled pattern so repeated searches skip RegExp construction
+  _compilePattern(terms) {
+    const key = terms.join('\x00');
+    if (this._pattern?.key !== key) {
+      const source = terms.map(t => t.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|');
+      this._pattern = { key, regex: new RegExp(source, 'g') };
+    }
+    return this._pattern.regex;
+  }
+
+  // Binary search for the course whose haystack slice contains pos
+  _courseAt(pos) {
+    let lo = 0;
+    let hi = this._offsets.length - 1;
+    while (lo < hi) {
+      const mid = (lo + hi + 1) >> 1;
+      if (this._offsets[mid] <= pos) lo = mid;
+      else hi = mid - 1;
+    }
+    return lo;
+  }
+
+  // Courses containing every query term, best cosine match first
+  _rankedSearch(query) {
+    const terms = new Set(tokenize(query));
+    if (!terms.size || ![...terms].every(t => this._idf.has(t))) return [];
+
+    const scores = new Map();
+    const hits = new Map();
+    for (const [t, qWeight] of this._weigh([...terms])) {
+      for (const [i, dWeight] of this._postings.get(t)) {
+        scores.set(i, (scores.get(i) || 0) + qWeight * dWeight);
+        hits.set(i, (hits.get(i) || 0) + 1);
+      }
+    }
+
+    return [...scores]
+      .filter(([i]) => hits.get(i) === terms.size)
+      .sort((a, b) => b[1] - a[1])
+      .map(([i]) => this._snapshot[i]);
+  }
+
+  async _statCache(cacheFile) {
     try {
-      const stats = await fs.stat(cacheFile);
-      return (Date.now() - stats.mtimeMs) / (1000 * 60 * 60);
+      return await fs.stat(cacheFile);
     } catch {
-      return Infinity;
+      return null;
     }
   }
 
-  async _loadCache(cacheFile) {
-    const data = await fs.readFile(cacheFile, 'utf-8');
-    return JSON.parse(data);
+  _getCacheAge(stats) {
+    return stats ? (Date.now() - stats.mtimeMs) / (1000 * 60 * 60) : Infinity;
   }
 
+  // Reuses the parsed courses until the cache file's mtime changes
+  async _loadCache(cacheFile, stats = null) {
+    const { mtimeMs } = stats || await fs.stat(cacheFile);
+    const memo = this._memCache;
+    if (memo && memo.file === cacheFile && memo.mtimeMs === mtimeMs) return memo.courses;
+
+    const courses = await this._decodeCache(cacheFile, await fs.readFile(cacheFile));
+    this._memCache = { file: cacheFile, mtimeMs, courses };
+    return courses;
+  }
+
+  // Returns whether the cache was written
   async _saveCache(cacheFile, data) {
     try {
-      await fs.writeFile(cacheFile, JSON.stringify(data, null, 2));
+      await this._writeAtomic(cacheFile, await this._encodeCache(cacheFile, data));
+      const { mtimeMs } = await fs.stat(cacheFile);
+      this._memCache = { file: cacheFile, mtimeMs, courses: data };
       console.log('💾 Saved to', cacheFile);
+      return true;
     } catch (error) {
       console.error(`✗ Cache save error: ${error.message}`);
+      return false;
+    }
+  }
+
+  async _conditionalHeaders() {
+    try {
+      const meta = JSON.parse(await fs.readFile(this.metaFile, 'utf-8'));
+      const headers = {};
+      if (meta.etag) headers['If-None-Match'] = meta.etag;
+      if (meta.lastModified) headers['If-Modified-Since'] = meta.lastModified;
+      return headers;
+    } catch {
+      return {};
+    }
+  }
+
+  async _saveMeta(headers) {
+    const meta = { etag: headers.get('etag'), lastModified: headers.get('last-modified') };
+    try {
+      await this._writeAtomic(this.metaFile, JSON.stringify(meta));
+    } catch (error) {
+      console.error(`✗ Cache meta save error: ${error.message}`);
     }
   }
+
+  // Write to a temp file and rename over the target so a crash never leaves a truncated cache
+  async _writeAtomic(file, data) {
+    const tmpFile = `${file}.${process.pid}.${randomUUID()}.tmp`;  // unique per write
+    try {
+      await fs.writeFile(tmpFile, data);
+      await fs.rename(tmpFile, file);
+    } catch (error) {
+      await fs.rm(tmpFile, { force: true });
+      throw error;
+    }
+  }
+
+  // Cache (de)serialization lives here so the on-disk format can change in one place
+  async _encodeCache(cacheFile, data) {
+    const json = Buffer.from(JSON.stringify(data, null, this.indent), 'utf-8');
+    const codec = CODECS[path.extname(cacheFile)];
+    return codec ? await codec.encode(json) : json;
+  }
+
+  async _decodeCache(cacheFile, buffer) {
+    const codec = CODECS[path.extname(cacheFile)];
+    const json = codec ? await codec.decode(buffer) : buffer;
+    return JSON.parse(json.toString('utf-8'));
+  }
 }
 
 // Convenience functions
@@ -164,7 +620,8 @@ module.exports = { CourseFetcher, getAllCourses, searchCourse };
 if (require.main === module) {
   (async () => {
     console.log('Generating CSC course data\n' + '='.repeat(50));
-    const fetcher = new CourseFetcher();
+    // The generated catalog is committed, so keep it readable in diffs
+    const fetcher = new CourseFetcher('./data', { indent: 2 });
     const courses = await fetcher.fetchAllCourses(false); // force fresh fetch
 
     if (courses) {